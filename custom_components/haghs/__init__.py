@@ -6,15 +6,16 @@ import logging
 import math
 import os
 import re
-from dataclasses import dataclass, field
-from datetime import timedelta
-from typing import Any
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 import psutil
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
-from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
@@ -42,19 +43,39 @@ from .const import (
     REC_ZOMBIES,
 )
 
+if TYPE_CHECKING:
+    from homeassistant.core import EventStateChangedData
+
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["sensor"]
 
+# hass.data key for the index shared by all config entries
+DATA_INDEX = f"{DOMAIN}_index"
+
 # Size constants
+_MB = 1024**2
 _GB = 1024**3
 
+# Storage types that use the SD-Card / eMMC (absolute free space) logic
+_FLASH_STORAGE_TYPES: frozenset[str] = frozenset(["sd-card", "emmc"])
+
+# SD-Card / eMMC free-space thresholds (bytes)
+_FLASH_DISK_CRITICAL = 3 * _GB
+_FLASH_DISK_WARNING = 5 * _GB
+
 # Timeout for each scoring sub-calculation (seconds).
 PILLAR_TIMEOUT: float = 10.0
 
 # Default HA SQLite database filename
 HA_DB_NAME = "home-assistant_v2.db"
 
+# Recorder db_url prefix for file-backed SQLite databases
+_SQLITE_URL_PREFIX = "sqlite:///"
+
+# The SQLite file grows slowly — re-stat it at most this often
+DB_SIZE_CHECK_INTERVAL = timedelta(minutes=30)
+
 # PSI (Pressure Stall Information) paths — Linux only
 PSI_CPU_PATH = "/proc/pressure/cpu"
 PSI_MEMORY_PATH = "/proc/pressure/memory"
@@ -63,6 +84,27 @@ PSI_IO_PATH = "/proc/pressure/io"
 # Regex to extract 'some avg10=X.XX' from PSI files
 _PSI_SOME_AVG10_RE = re.compile(r"some\s+avg10=(\d+\.?\d*)")
 
+# States that mark an entity as unavailable (zombie candidates, bad readings)
+_UNAVAILABLE_STATES: frozenset[str] = frozenset([STATE_UNAVAILABLE, STATE_UNKNOWN])
+
+# Registry fields whose change can alter the ignore-label sets
+_ENTITY_LABEL_FIELDS: frozenset[str] = frozenset(["labels", "device_id", "entity_id"])
+_DEVICE_LABEL_FIELDS: frozenset[str] = frozenset(["labels"])
+
+# Tiered hardware penalties — upper bounds (inclusive) per tier.  A value
+# above the last bound gets the last penalty: 0 / 10 / 25 / 50 / 80.
+_TIER_PENALTIES: tuple[int, ...] = (0, 10, 25, 50, 80)
+_CLASSIC_CPU_TIERS: tuple[float, ...] = (25, 40, 60, 80)
+_PSI_CPU_TIERS: tuple[float, ...] = (5, 15, 30, 50)
+_PSI_MEMORY_TIERS: tuple[float, ...] = (5, 10, 25, 40)
+_PSI_IO_TIERS: tuple[float, ...] = (5, 15, 30, 50)
+
+# Grace period before an unavailable/unknown entity counts as a zombie
+ZOMBIE_GRACE_PERIOD = timedelta(minutes=15)
+
+# Max zombie entity IDs exposed as state attribute (count stays full)
+ZOMBIE_LIST_CAP = 20
+
 # Domains to check for zombie entities
 ZOMBIE_DOMAINS: frozenset[str] = frozenset(
     [
@@ -79,7 +121,34 @@ ZOMBIE_DOMAINS: frozenset[str] = frozenset(
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class _HaghsOptions:
+    """Config entry settings, resolved once per coordinator lifetime."""
+
+    cpu_id: str | None = None
+    ram_id: str | None = None
+    db_sensor_id: str | None = None
+    ignore_label: str | None = None
+    storage_type: str = DEFAULT_STORAGE_TYPE
+    update_interval: int = DEFAULT_UPDATE_INTERVAL
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> _HaghsOptions:
+        """Build options from a config entry — options override data."""
+        opts: dict[str, Any] = {**entry.data, **entry.options}
+        return cls(
+            cpu_id=opts.get(CONF_CPU_SENSOR),
+            ram_id=opts.get(CONF_RAM_SENSOR),
+            db_sensor_id=opts.get(CONF_DB_SENSOR) or None,
+            ignore_label=opts.get(CONF_IGNORE_LABEL),
+            storage_type=opts.get(CONF_STORAGE_TYPE, DEFAULT_STORAGE_TYPE),
+            update_interval=int(
+                opts.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+            ),
+        )
+
+
+@dataclass(slots=True)
 class _PsiData:
     """Pressure Stall Information (some avg10 values).
 
@@ -96,7 +165,7 @@ class _PsiData:
         return self.cpu is not None and self.memory is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class _HardwareResult:
     """Result of the hardware pillar calculation."""
 
@@ -113,7 +182,7 @@ class _HardwareResult:
     psi_available: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class _ApplicationResult:
     """Result of the application pillar calculation."""
 
@@ -130,7 +199,17 @@ class _ApplicationResult:
     p_zombie: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
+class _StateScan:
+    """Zombies, pending updates and entity count read for one cycle."""
+
+    total_entities: int = 0
+    zombie_count: int = 0
+    zombie_list: list[str] = field(default_factory=list)
+    pending_updates: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
 class _RecorderInfo:
     """Recorder configuration data — prepared for Phase 3 scoring."""
 
@@ -139,34 +218,219 @@ class _RecorderInfo:
     available: bool = False
 
 
+class _HaghsIndex:
+    """State and registry index shared by all HAGHS config entries.
+
+    Holds the event-maintained zombie candidates and the ignore-label
+    sets, so every entry shares one set of listeners and one registry
+    pass per label instead of building its own.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+
+        # Registries live for the lifetime of HA — resolve them once
+        self._ent_reg: er.EntityRegistry = er.async_get(hass)
+        self._dev_reg: dr.DeviceRegistry = dr.async_get(hass)
+
+        # Zombie-domain entities currently unavailable/unknown, mapped to
+        # their last_changed — maintained incrementally from state_changed
+        self.zombie_candidates: dict[str, datetime] = {}
+
+        # Ignored entity IDs per label — dropped on any registry update
+        self._ignored: dict[str, frozenset[str]] = {}
+
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._users = 0
+
+    @callback
+    def async_acquire(self) -> None:
+        """Register a config entry; start listening on first use."""
+        if self._users == 0:
+            self._async_start()
+        self._users += 1
+
+    @callback
+    def async_release(self) -> None:
+        """Unregister a config entry; stop listening after the last one."""
+        self._users -= 1
+        if self._users > 0:
+            return
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self.zombie_candidates.clear()
+        self._ignored.clear()
+        self.hass.data.pop(DATA_INDEX, None)
+
+    @callback
+    def _async_start(self) -> None:
+        """Seed the zombie candidates and subscribe to the relevant events.
+
+        One scan at setup, then O(1) work per state change.  The update
+        cycle only has to apply the grace period and ignore labels to the
+        (usually tiny) candidate set.  Labels are assigned via the entity
+        and device registries, so the ignore sets only need rebuilding
+        after one of their update events.
+        """
+        self.zombie_candidates = {
+            state.entity_id: state.last_changed
+            for state in self.hass.states.async_all(ZOMBIE_DOMAINS)
+            if self._is_zombie_candidate(state)
+        }
+        bus = self.hass.bus
+        self._unsubs = [
+            # Plain listener: other domains cost one dict pop.  HA's
+            # domain-tracking helpers resubscribe every tracked entity
+            # whenever a new one appears, which is far worse at startup.
+            bus.async_listen(EVENT_STATE_CHANGED, self._async_handle_state_changed),
+            bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_invalidate_ignored
+            ),
+            bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_invalidate_ignored
+            ),
+        ]
+
+    @callback
+    def _async_handle_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Add or drop an entity from the zombie candidate set."""
+        new_state = event.data["new_state"]
+        if new_state is not None and self._is_zombie_candidate(new_state):
+            self.zombie_candidates[event.data["entity_id"]] = (
+                new_state.last_changed
+            )
+        else:
+            self.zombie_candidates.pop(event.data["entity_id"], None)
+
+    @staticmethod
+    def _is_zombie_candidate(state: State) -> bool:
+        """Return True if *state* may count as a zombie (before grace period).
+
+        Integration health sensors are excluded here, once per state
+        change, rather than on every update cycle.
+        """
+        return (
+            state.state in _UNAVAILABLE_STATES
+            and state.domain in ZOMBIE_DOMAINS
+            and "integration_health" not in state.object_id
+        )
+
+    @callback
+    def _async_invalidate_ignored(self, event: Event) -> None:
+        """Drop all ignore sets so the next cycle rebuilds them.
+
+        Registry updates that touch no label-relevant field (names, icons,
+        areas, ...) keep the cached sets.
+        """
+        if event.data.get("action") == "update":
+            relevant = (
+                _ENTITY_LABEL_FIELDS
+                if event.event_type == er.EVENT_ENTITY_REGISTRY_UPDATED
+                else _DEVICE_LABEL_FIELDS
+            )
+            if relevant.isdisjoint(event.data.get("changes", {})):
+                return
+        self._ignored.clear()
+
+    @callback
+    def async_get_ignored_ids(self, label: str | None) -> frozenset[str]:
+        """Return all entity IDs that carry *label*.
+
+        An entity is ignored if the label is assigned to the entity itself
+        or to its parent device.  Built in a single pass over the entity
+        registry so the scans only need O(1) membership tests, and cached
+        until a registry update invalidates it.
+        """
+        if not label:
+            return frozenset()
+        cached = self._ignored.get(label)
+        if cached is not None:
+            return cached
+
+        ignored_devices = {
+            device.id
+            for device in self._dev_reg.devices.values()
+            if label in (device.labels or set())
+        }
+        ignored = frozenset(
+            entity.entity_id
+            for entity in self._ent_reg.entities.values()
+            if label in (entity.labels or set())
+            or entity.device_id in ignored_devices
+        )
+        self._ignored[label] = ignored
+        return ignored
+
+
+@callback
+def _async_get_index(hass: HomeAssistant) -> _HaghsIndex:
+    """Return the shared index, creating it on first use."""
+    index: _HaghsIndex | None = hass.data.get(DATA_INDEX)
+    if index is None:
+        index = hass.data[DATA_INDEX] = _HaghsIndex(hass)
+    return index
+
+
 class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator that calculates the Global Health Score."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, index: _HaghsIndex
+    ) -> None:
         """Initialize the coordinator."""
         # Options take priority over data for runtime-configurable fields
-        opts: dict = {**entry.data, **entry.options}
+        self.options: _HaghsOptions = _HaghsOptions.from_entry(entry)
 
-        interval_sec = int(opts.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=interval_sec),
+            update_interval=timedelta(seconds=self.options.update_interval),
+            # Only notify the sensor (state write, recorder row, websocket
+            # push) when the computed data actually differs
+            always_update=False,
+        )
+
+        # Storage type classified once — SD-Card/eMMC vs. SSD thresholds
+        self._flash_storage: bool = (
+            self.options.storage_type in _FLASH_STORAGE_TYPES
         )
-        self.cpu_id: str | None = opts.get(CONF_CPU_SENSOR)
-        self.ram_id: str | None = opts.get(CONF_RAM_SENSOR)
-        self.db_sensor_id: str | None = opts.get(CONF_DB_SENSOR) or None
-        self.ignore_label: str | None = opts.get(CONF_IGNORE_LABEL)
-        self._storage_type: str = opts.get(CONF_STORAGE_TYPE, DEFAULT_STORAGE_TYPE)
-
-        # Paths for auto-detection (resolved once at init)
-        self._db_path: str = hass.config.path(HA_DB_NAME)
+
+        # Paths for auto-detection (resolved once at init).  The DB path is
+        # replaced by the recorder's actual db_url once it is known; None
+        # means no local SQLite file (external database).
+        self._db_path: str | None = hass.config.path(HA_DB_NAME)
         self._config_dir: str = hass.config.config_dir
 
-        # Recorder info — populated on each update cycle (Phase 3 ready)
+        # Last SQLite size measurement as (measured_at, size_mb)
+        self._db_size_cache: tuple[datetime, float] | None = None
+
+        # Recorder info — read until the recorder is found, then kept: its
+        # keep_days/filter come from YAML and only change on HA restart
         self.recorder_info: _RecorderInfo = _RecorderInfo()
 
+        # Zombie candidates and ignore-label sets, shared by all entries
+        self._index: _HaghsIndex = index
+
+        # Parsed sensor values keyed by entity_id, tagged with the State
+        # object they came from (see _get_float)
+        self._float_cache: dict[str, tuple[State | None, float]] = {}
+
+        # Entity IDs carrying the ignore label — taken from the shared index
+        # at the start of each update cycle
+        self._ignored_ids: frozenset[str] = frozenset()
+
+    async def async_apply_interval(self, options: _HaghsOptions) -> None:
+        """Adopt *options* whose only change is the update interval."""
+        self.options = options
+        self.update_interval = timedelta(seconds=options.update_interval)
+        # Refresh now so the new interval is used for the next schedule
+        await self.async_request_refresh()
+
     # ------------------------------------------------------------------
     # Main update — orchestrates sub-calculations with safety net
     # ------------------------------------------------------------------
@@ -174,34 +438,43 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data and calculate the health score.
 
-        Each pillar runs in its own guarded coroutine.  On timeout or
-        exception the affected pillar falls back to a neutral score
-        (100 / no penalty) and a warning is logged.  The coordinator
+        Each pillar runs in its own guarded coroutine; both run concurrently
+        so their executor jobs (PSI, disk usage, DB size) overlap.  On
+        timeout or exception the affected pillar falls back to a neutral
+        score (100 / no penalty) and a warning is logged.  The coordinator
         itself never crashes.
         """
         # Recorder info — read before app pillar so config audit can use it
-        self.recorder_info = self._read_recorder_info()
-
-        hw = await self._safe_calc(
-            "hardware",
-            self._async_calc_hardware(),
-            _HardwareResult(),
+        if not self.recorder_info.available:
+            self.recorder_info = self._read_recorder_info()
+            if self.recorder_info.available:
+                self._db_path = self._resolve_db_path()
+                self._db_size_cache = None
+
+        # Ignore-label index — shared, reused until a registry update
+        self._ignored_ids = self._index.async_get_ignored_ids(
+            self.options.ignore_label
         )
 
-        app = await self._safe_calc(
-            "application",
-            self._async_calc_application(),
-            _ApplicationResult(),
+        hw, app = await asyncio.gather(
+            self._safe_calc(
+                "hardware",
+                self._async_calc_hardware(),
+                _HardwareResult(),
+            ),
+            self._safe_calc(
+                "application",
+                self._async_calc_application(),
+                _ApplicationResult(),
+            ),
         )
 
-        global_score = max(0, min(100, math.floor(
-            (hw.hardware_score * 0.4) + (app.app_score * 0.6)
-        )))
+        global_score = self._weighted_global_score(hw.hardware_score, app.app_score)
 
         advice = self._build_recommendations(hw, app)
 
         return {
-            "global_score": int(global_score),
+            "global_score": global_score,
             "hardware_score": int(hw.hardware_score),
             "application_score": app.app_score,
             "zombie_count": app.zombie_count,
@@ -216,6 +489,16 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ),
         }
 
+    @staticmethod
+    def _weighted_global_score(hardware_score: float, app_score: int) -> int:
+        """Combine the pillars: 40 % hardware + 60 % application, floored.
+
+        Weighted as 2:3 and divided in integers so exact results (e.g. 74.0)
+        are not lost to float rounding of 0.4 / 0.6; both pillars are
+        non-negative.
+        """
+        return min(100, int((hardware_score * 2) + (app_score * 3)) // 5)
+
     async def _safe_calc(
         self,
         name: str,
@@ -241,16 +524,27 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return fallback
 
     # ------------------------------------------------------------------
-    # PSI (Pressure Stall Information) reader
+    # Hardware readers — PSI (Pressure Stall Information) and disk usage
     # ------------------------------------------------------------------
 
-    async def _async_read_psi(self) -> _PsiData:
-        """Read Linux PSI data from /proc/pressure via executor.
+    async def _async_read_hardware(self) -> tuple[_PsiData, Any | None]:
+        """Read Linux PSI data and disk usage in a single executor job.
 
         Returns _PsiData with None fields for any file that cannot be read
-        (Windows, old kernels, containers without /proc mounted).
+        (Windows, old kernels, containers without /proc mounted), and None
+        for disk usage if it cannot be determined.
         """
-        return await self.hass.async_add_executor_job(self._read_psi_sync)
+        return await self.hass.async_add_executor_job(
+            self._read_hardware_sync, self._config_dir
+        )
+
+    @staticmethod
+    def _read_hardware_sync(config_dir: str) -> tuple[_PsiData, Any | None]:
+        """Synchronous hardware reader — runs in the executor thread pool."""
+        return (
+            HaghsDataUpdateCoordinator._read_psi_sync(),
+            HaghsDataUpdateCoordinator._get_disk_usage_sync(config_dir),
+        )
 
     @staticmethod
     def _read_psi_sync() -> _PsiData:
@@ -274,6 +568,18 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except (OSError, ValueError):
             return None
 
+    @staticmethod
+    def _get_disk_usage_sync(path: str) -> Any | None:
+        """Return full psutil disk_usage result, or None on failure."""
+        try:
+            return psutil.disk_usage(path)
+        except (OSError, FileNotFoundError):
+            _LOGGER.warning(
+                "HAGHS: Could not read disk usage for %s — assuming healthy",
+                path,
+            )
+            return None
+
     # ------------------------------------------------------------------
     # Hardware pillar (40 %)
     # ------------------------------------------------------------------
@@ -292,8 +598,10 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         These require separate threshold tiers because their scales differ
         fundamentally.
         """
-        # Try PSI first (non-blocking via executor)
-        psi = await self._async_read_psi()
+        opts = self.options
+
+        # PSI + disk usage in one executor round trip (non-blocking)
+        psi, disk_usage = await self._async_read_hardware()
         use_psi = psi.available
 
         # -- CPU --
@@ -301,12 +609,12 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             cpu = psi.cpu
             p_cpu = self._psi_cpu_penalty(cpu)
         else:
-            cpu = self._get_float(self.cpu_id)
+            cpu = self._get_float(opts.cpu_id)
             if cpu > 100:
                 _LOGGER.warning(
                     "HAGHS: CPU sensor '%s' returned %.1f — expected 0-100%%. "
                     "Please select a sensor that reports CPU usage in percent",
-                    self.cpu_id,
+                    opts.cpu_id,
                     cpu,
                 )
                 cpu = min(cpu, 100.0)
@@ -318,12 +626,12 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ram = psi.memory
             p_ram = self._psi_memory_penalty(ram)
         else:
-            ram = self._get_float(self.ram_id)
+            ram = self._get_float(opts.ram_id)
             if ram > 100:
                 _LOGGER.warning(
                     "HAGHS: RAM sensor '%s' returned %.1f — expected 0-100%%. "
                     "Please select a sensor that reports memory usage in percent",
-                    self.ram_id,
+                    opts.ram_id,
                     ram,
                 )
                 ram = min(ram, 100.0)
@@ -338,17 +646,16 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         score_io = 100 - p_io
 
         # -- Disk: always auto-detected via psutil — smart thresholds --
-        disk_usage = await self._async_get_disk_usage()
         if disk_usage is not None:
             disk_total = disk_usage.total
             disk_free = disk_usage.free
             disk_pct = disk_usage.percent
 
-            if self._storage_type in ("sd-card", "emmc"):
+            if self._flash_storage:
                 # SD-Card / eMMC logic: critical < 3 GB free, warning < 5 GB free
-                if disk_free < 3 * _GB:
+                if disk_free < _FLASH_DISK_CRITICAL:
                     score_disk = 0.0
-                elif disk_free < 5 * _GB:
+                elif disk_free < _FLASH_DISK_WARNING:
                     score_disk = 50.0
                 else:
                     score_disk = 100.0
@@ -368,16 +675,11 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # -- Final hardware score --
         # When PSI I/O is available: 4 components (CPU, RAM, I/O, Disk)
         # When I/O is not available: 3 components (CPU, RAM, Disk)
+        # Every component is already within 0-100, so the mean needs no clamp.
         if psi.io is not None:
-            hardware_final = max(
-                0.0,
-                min(100.0, (score_cpu + score_ram + score_io + score_disk) / 4),
-            )
+            hardware_final = (score_cpu + score_ram + score_io + score_disk) / 4
         else:
-            hardware_final = max(
-                0.0,
-                min(100.0, (score_cpu + score_ram + score_disk) / 3),
-            )
+            hardware_final = (score_cpu + score_ram + score_disk) / 3
 
         if use_psi:
             _LOGGER.debug(
@@ -412,15 +714,7 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Classic sensors report how busy the CPU is.  25% is normal for an
         active system, so penalties only start above that threshold.
         """
-        if cpu <= 25:
-            return 0
-        if cpu <= 40:
-            return 10
-        if cpu <= 60:
-            return 25
-        if cpu <= 80:
-            return 50
-        return 80
+        return _TIER_PENALTIES[bisect_left(_CLASSIC_CPU_TIERS, cpu)]
 
     @staticmethod
     def _psi_cpu_penalty(psi_val: float) -> int:
@@ -429,15 +723,7 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         PSI measures how long tasks waited for CPU.  Even 5% stall time
         is noticeable — automation latency increases measurably.
         """
-        if psi_val <= 5:
-            return 0
-        if psi_val <= 15:
-            return 10
-        if psi_val <= 30:
-            return 25
-        if psi_val <= 50:
-            return 50
-        return 80
+        return _TIER_PENALTIES[bisect_left(_PSI_CPU_TIERS, psi_val)]
 
     # -- RAM penalty tiers -------------------------------------------------
 
@@ -463,15 +749,7 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Memory stalls are more critical than CPU stalls because they can
         trigger the OOM killer.  Thresholds are tighter than CPU.
         """
-        if psi_val <= 5:
-            return 0
-        if psi_val <= 10:
-            return 10
-        if psi_val <= 25:
-            return 25
-        if psi_val <= 40:
-            return 50
-        return 80
+        return _TIER_PENALTIES[bisect_left(_PSI_MEMORY_TIERS, psi_val)]
 
     # -- I/O penalty tiers -------------------------------------------------
 
@@ -482,28 +760,7 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         I/O stalls directly affect recorder writes, automation execution,
         and restart times.  Thresholds match CPU PSI.
         """
-        if psi_val <= 5:
-            return 0
-        if psi_val <= 15:
-            return 10
-        if psi_val <= 30:
-            return 25
-        if psi_val <= 50:
-            return 50
-        return 80
-
-    async def _async_get_disk_usage(self) -> Any | None:
-        """Return full psutil disk_usage result, or None on failure."""
-        try:
-            return await self.hass.async_add_executor_job(
-                psutil.disk_usage, self._config_dir
-            )
-        except (OSError, FileNotFoundError):
-            _LOGGER.warning(
-                "HAGHS: Could not read disk usage for %s — assuming healthy",
-                self._config_dir,
-            )
-            return None
+        return _TIER_PENALTIES[bisect_left(_PSI_IO_TIERS, psi_val)]
 
     # ------------------------------------------------------------------
     # Application pillar (60 %)
@@ -511,18 +768,24 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_calc_application(self) -> _ApplicationResult:
         """Calculate the application pillar score."""
+        # Zombie candidates, update-domain states and the entity count —
+        # feeds zombies, updates and DB limit
+        scan = self._scan_states()
+
         # A. ZOMBIES
-        zombie_list, p_zombie, zombie_count = self._calc_zombies()
+        zombie_list, p_zombie, zombie_count = self._calc_zombies(scan)
 
         # B. INTEGRATION HEALTH
         p_integration = self._calc_integration_health()
 
         # C. MAINTENANCE — DB size auto-detected (blocking I/O → executor)
-        db_mb, p_db, db_limit_mb = await self._async_calc_maintenance()
+        db_mb, p_db, db_limit_mb = await self._async_calc_maintenance(
+            scan.total_entities
+        )
 
         # D. UPDATES
         p_backup, update_count, p_updates, p_core_lag, pending_updates = (
-            self._calc_updates()
+            self._calc_updates(scan)
         )
 
         # E. CONFIG AUDIT — bonus for good recorder configuration
@@ -555,62 +818,64 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # Application sub-calculations
     # ------------------------------------------------------------------
 
-    def _calc_zombies(self) -> tuple[list[str], int, int]:
-        """Detect zombie entities, respecting ignore labels and grace period.
+    def _scan_states(self) -> _StateScan:
+        """Collect zombies, pending updates and the total entity count.
 
-        Returns (zombie_list_capped, p_zombie, zombie_count).
-        zombie_list is capped to 20 entries for state attributes;
-        zombie_count always reflects the full number.
+        Zombies come from the event-maintained candidate set (respecting
+        ignore labels and grace period); pending updates only walk the
+        update domain, and the total entity count comes straight from the
+        state machine — no full-state traversal per cycle.
         """
-        ent_reg = er.async_get(self.hass)
-        dev_reg = dr.async_get(self.hass)
-        now = dt_util.utcnow()
-        zombie_list: list[str] = []
+        ignored_ids = self._ignored_ids
+        grace_cutoff = dt_util.utcnow() - ZOMBIE_GRACE_PERIOD
+        scan = _StateScan(total_entities=self.hass.states.async_entity_ids_count())
 
-        for state in self.hass.states.async_all():
-            if state.domain not in ZOMBIE_DOMAINS:
-                continue
-            if state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        zombie_count = 0
+        zombie_append = scan.zombie_list.append
+        for entity_id, last_changed in sorted(self._index.zombie_candidates.items()):
+            # Grace period: skip entities that changed < 15 min ago
+            if last_changed > grace_cutoff:
                 continue
 
-            # Grace period: skip entities that changed < 15 min ago
-            if (now - state.last_changed).total_seconds() < 900:
+            if entity_id in ignored_ids:
                 continue
 
+            # Only the capped list is exposed — count the rest
+            zombie_count += 1
+            if zombie_count <= ZOMBIE_LIST_CAP:
+                zombie_append(entity_id)
+        scan.zombie_count = zombie_count
+
+        pending_append = scan.pending_updates.append
+        for state in self.hass.states.async_all("update"):
+            if state.state != "on":
+                continue
             entity_id = state.entity_id
-            if "integration_health" in entity_id:
+            if entity_id in ignored_ids:
                 continue
+            pending_append(state.attributes.get("friendly_name", entity_id))
 
-            is_ignored = False
-            entity_entry = ent_reg.async_get(entity_id)
-            if entity_entry and self.ignore_label in (
-                entity_entry.labels or set()
-            ):
-                is_ignored = True
-
-            if not is_ignored and entity_entry and entity_entry.device_id:
-                device_entry = dev_reg.async_get(entity_entry.device_id)
-                if device_entry and self.ignore_label in (
-                    device_entry.labels or set()
-                ):
-                    is_ignored = True
+        return scan
 
-            if not is_ignored:
-                zombie_list.append(entity_id)
+    def _calc_zombies(self, scan: _StateScan) -> tuple[list[str], int, int]:
+        """Calculate the zombie penalty from the state scan.
 
-        zombie_count = len(zombie_list)
+        Returns (zombie_list_capped, p_zombie, zombie_count).
+        zombie_list is capped to ZOMBIE_LIST_CAP entries for state
+        attributes; zombie_count always reflects the full number.
+        """
+        zombie_count = scan.zombie_count
 
         # Ratio-based penalty: percentage of zombies relative to total entities
         # Factor 7 + ceil ensures zombies are visible on all instance sizes
-        total_entities = len(self.hass.states.async_all())
+        total_entities = scan.total_entities
         if total_entities > 0:
             zombie_ratio_pct = (zombie_count / total_entities) * 100
             p_zombie = min(20, math.ceil(zombie_ratio_pct * 7))
         else:
             p_zombie = 0
 
-        # Cap the list for state attributes (count stays full)
-        return zombie_list[:20], p_zombie, zombie_count
+        return scan.zombie_list, p_zombie, zombie_count
 
     def _calc_integration_health(self) -> int:
         """Count unhealthy integrations via native ConfigEntry states.
@@ -631,10 +896,11 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         return min(15, failed * 5)
 
-    async def _async_calc_maintenance(self) -> tuple[float, int, float]:
+    async def _async_calc_maintenance(
+        self, total_entities: int
+    ) -> tuple[float, int, float]:
         """Calculate DB penalty with dynamic limit based on entity count."""
         db_mb = await self._async_get_db_size_mb()
-        total_entities = len(self.hass.states.async_all())
         db_limit_mb = 1000 + (total_entities * 2.5)
 
         p_db = 0
@@ -652,66 +918,66 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         If an external DB sensor is configured, its state is used directly
         (expected to report size in MB).  Otherwise falls back to measuring
-        the local SQLite file via os.path.getsize.
+        the local SQLite file via os.path.getsize, re-measured at most every
+        DB_SIZE_CHECK_INTERVAL.
         Returns 0.0 if no measurement is available (external DB without
         sensor, or missing SQLite file).
         """
         # External DB sensor override
-        if self.db_sensor_id:
-            val = self._get_float(self.db_sensor_id)
+        db_sensor_id = self.options.db_sensor_id
+        if db_sensor_id:
+            val = self._get_float(db_sensor_id)
             if val > 0:
                 _LOGGER.debug(
                     "HAGHS: Using external DB sensor '%s' — %.1f MB",
-                    self.db_sensor_id,
+                    db_sensor_id,
                     val,
                 )
                 return val
             _LOGGER.debug(
                 "HAGHS: External DB sensor '%s' returned %.1f — "
                 "skipping DB penalty",
-                self.db_sensor_id,
+                db_sensor_id,
                 val,
             )
             return 0.0
 
         # Default: local SQLite file
+        if self._db_path is None:
+            return 0.0
+        now = dt_util.utcnow()
+        cached = self._db_size_cache
+        if cached is not None and now - cached[0] < DB_SIZE_CHECK_INTERVAL:
+            return cached[1]
         try:
             size_bytes: int = await self.hass.async_add_executor_job(
                 os.path.getsize, self._db_path
             )
-            return size_bytes / (1024 * 1024)
+            db_mb = size_bytes / _MB
         except OSError:
             _LOGGER.debug(
                 "HAGHS: SQLite DB not found at %s — assuming external database",
                 self._db_path,
             )
-            return 0.0
+            db_mb = 0.0
+        self._db_size_cache = (now, db_mb)
+        return db_mb
 
-    def _calc_updates(self) -> tuple[int, int, int, int, list[str]]:
+    def _calc_updates(
+        self, scan: _StateScan
+    ) -> tuple[int, int, int, int, list[str]]:
         """Calculate backup, update and core-lag penalties.
 
         Returns (p_backup, update_count, p_updates, p_core_lag, pending_updates).
-        Update entities with the ignore label are excluded from counting and penalties.
+        Update entities with the ignore label (directly or via their device)
+        are excluded from counting and penalties.
         Core lag threshold: >= 3 months behind.
         """
         backup_state = self.hass.states.get("binary_sensor.backups_stale")
         p_backup = 30 if (backup_state and backup_state.state == "on") else 0
 
-        ent_reg = er.async_get(self.hass)
-        update_count = 0
-        pending_updates: list[str] = []
-
-        for state in self.hass.states.async_all():
-            if state.domain == "update" and state.state == "on":
-                # Check ignore label on update entity
-                entity_entry = ent_reg.async_get(state.entity_id)
-                if entity_entry and self.ignore_label in (
-                    entity_entry.labels or set()
-                ):
-                    continue
-                update_count += 1
-                name = state.attributes.get("friendly_name", state.entity_id)
-                pending_updates.append(name)
+        pending_updates = scan.pending_updates
+        update_count = len(pending_updates)
 
         p_core_lag = 0
         core_entity_id = self._detect_core_update_entity()
@@ -784,6 +1050,24 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             return _RecorderInfo()
 
+    def _resolve_db_path(self) -> str | None:
+        """Return the SQLite file path from the recorder's db_url.
+
+        Returns None for external databases (MariaDB, PostgreSQL) and
+        in-memory SQLite so the size check is skipped without touching
+        the filesystem.  Falls back to the default path if the URL cannot
+        be read.
+        """
+        recorder = self.hass.data.get("recorder_instance")
+        db_url = getattr(recorder, "db_url", None)
+        if not isinstance(db_url, str):
+            return self._db_path
+        if not db_url.startswith(_SQLITE_URL_PREFIX):
+            _LOGGER.debug("HAGHS: Recorder uses an external database")
+            return None
+        path = db_url[len(_SQLITE_URL_PREFIX) :].split("?", 1)[0]
+        return path or None
+
     # ------------------------------------------------------------------
     # Dynamic core update entity detection
     # ------------------------------------------------------------------
@@ -822,6 +1106,7 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         All templates are defined in const.py (mirrored in strings.json)
         so translators can find and override them.
         """
+        storage_type = self.options.storage_type
         advice: list[str] = []
         if hw.p_cpu > 0:
             advice.append(REC_CPU_LOAD.format(cpu_pct=hw.cpu))
@@ -830,17 +1115,17 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if hw.p_io > 0:
             advice.append(REC_IO_PRESSURE.format(io_pct=hw.io))
         if (
-            self._storage_type in ("sd-card", "emmc")
-            and hw.disk_free < 5 * _GB
+            self._flash_storage
+            and hw.disk_free < _FLASH_DISK_WARNING
             and hw.disk_total > 0
         ):
             advice.append(
                 REC_DISK_SD_LOW.format(
                     free_gb=hw.disk_free / _GB,
-                    storage_type=self._storage_type,
+                    storage_type=storage_type,
                 )
             )
-        elif self._storage_type == "ssd" and hw.disk_total > 0:
+        elif not self._flash_storage and hw.disk_total > 0:
             free_pct = (hw.disk_free / hw.disk_total) * 100
             if free_pct < 10:
                 advice.append(
@@ -868,21 +1153,48 @@ class HaghsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # ------------------------------------------------------------------
 
     def _get_float(self, entity_id: str | None) -> float:
-        """Safely read a float value from an entity state."""
+        """Safely read a float value from an entity state.
+
+        State objects are immutable and replaced on every change, so the
+        parsed value is reused for as long as the state machine still holds
+        the same State object — across inputs and across update cycles.
+        """
         if not entity_id:
             return 0.0
         state = self.hass.states.get(entity_id)
-        if not state or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        cached = self._float_cache.get(entity_id)
+        if cached is not None and cached[0] is state:
+            return cached[1]
+        value = self._parse_float(state)
+        self._float_cache[entity_id] = (state, value)
+        return value
+
+    @staticmethod
+    def _parse_float(state: State | None) -> float:
+        """Return the numeric state value, or 0.0 if not available.
+
+        Non-finite values ("nan", "inf") count as not available, so they
+        cannot slip through the tier tables.
+        """
+        if not state:
+            return 0.0
+        value = state.state
+        if value in _UNAVAILABLE_STATES:
             return 0.0
         try:
-            return float(state.state)
+            number = float(value)
         except (ValueError, TypeError):
             return 0.0
+        return number if math.isfinite(number) else 0.0
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HAGHS from a config entry."""
-    coordinator = HaghsDataUpdateCoordinator(hass, entry)
+    index = _async_get_index(hass)
+    index.async_acquire()
+    entry.async_on_unload(index.async_release)
+
+    coordinator = HaghsDataUpdateCoordinator(hass, entry, index)
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
@@ -897,7 +1209,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def _async_update_options(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
-    """Reload the integration when options change."""
+    """Apply changed options.
+
+    An update-interval-only change is applied to the running coordinator
+    in place; any other change reloads the integration.
+    """
+    coordinator: HaghsDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    new_options = _HaghsOptions.from_entry(entry)
+    if new_options == coordinator.options:
+        return
+
+    if new_options == replace(
+        coordinator.options, update_interval=new_options.update_interval
+    ):
+        await coordinator.async_apply_interval(new_options)
+        return
+
     await hass.config_entries.async_reload(entry.entry_id)
 
 
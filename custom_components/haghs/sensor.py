@@ -1,17 +1,29 @@
 """HAGHS Sensor — CoordinatorEntity backed by HaghsDataUpdateCoordinator."""
 from __future__ import annotations
 
-from typing import Any
-
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import HaghsDataUpdateCoordinator
 from .const import DEFAULT_NAME, DOMAIN
 
+# Coordinator data keys exposed as state attributes (in display order)
+_ATTRIBUTE_KEYS: tuple[str, ...] = (
+    "hardware_score",
+    "application_score",
+    "zombie_count",
+    "zombie_entities",
+    "db_size_mb",
+    "psi_available",
+    "recorder_keep_days",
+    "recorder_filter_active",
+    "pending_updates",
+    "recommendations",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,29 +49,27 @@ class HaghsSensor(CoordinatorEntity[HaghsDataUpdateCoordinator], SensorEntity):
         self._attr_unique_id = f"{entry.entry_id}_score"
         self._attr_icon = "mdi:shield-check"
         self._attr_native_unit_of_measurement = "%"
+        self._update_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached value and attributes, then write state."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the current health score."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data["global_score"]
+    def _update_from_data(self) -> None:
+        """Build score and attributes once per coordinator update.
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return detailed score breakdown as attributes."""
-        if self.coordinator.data is None:
-            return None
+        The state machine reads native_value and extra_state_attributes on
+        every write; caching them here avoids rebuilding the attribute dict
+        on each access.
+        """
         data = self.coordinator.data
-        return {
-            "hardware_score": data["hardware_score"],
-            "application_score": data["application_score"],
-            "zombie_count": data["zombie_count"],
-            "zombie_entities": data["zombie_entities"],
-            "db_size_mb": data["db_size_mb"],
-            "psi_available": data["psi_available"],
-            "recorder_keep_days": data["recorder_keep_days"],
-            "recorder_filter_active": data["recorder_filter_active"],
-            "pending_updates": data["pending_updates"],
-            "recommendations": data["recommendations"],
+        if data is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
+        self._attr_native_value = data["global_score"]
+        self._attr_extra_state_attributes = {
+            key: data[key] for key in _ATTRIBUTE_KEYS
         }
@@ -0,0 +1,13 @@
+"""Fixtures for HAGHS tests.
+
+Requires pytest-homeassistant-custom-component, which provides the
+``hass`` fixture.
+"""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable loading custom integrations in all tests."""
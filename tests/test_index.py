@@ -0,0 +1,48 @@
+"""Tests for the shared zombie candidate index."""
+from __future__ import annotations
+
+from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant
+
+from custom_components.haghs import _async_get_index
+
+
+async def test_seed_from_existing_states(hass: HomeAssistant) -> None:
+    """Existing unavailable zombie-domain states are picked up at start."""
+    hass.states.async_set("light.dead", STATE_UNAVAILABLE)
+    hass.states.async_set("light.alive", STATE_ON)
+    hass.states.async_set("automation.off", STATE_UNAVAILABLE)
+
+    index = _async_get_index(hass)
+    index.async_acquire()
+
+    assert list(index.zombie_candidates) == ["light.dead"]
+    index.async_release()
+
+
+async def test_back_to_back_changes(hass: HomeAssistant) -> None:
+    """A new zombie and a recovered one in quick succession are both seen."""
+    hass.states.async_set("light.dead", STATE_UNAVAILABLE)
+
+    index = _async_get_index(hass)
+    index.async_acquire()
+
+    hass.states.async_set("switch.z", STATE_UNKNOWN)
+    hass.states.async_set("light.dead", STATE_ON)
+    await hass.async_block_till_done()
+
+    assert list(index.zombie_candidates) == ["switch.z"]
+    index.async_release()
+
+
+async def test_release_stops_tracking(hass: HomeAssistant) -> None:
+    """The last release clears the index and stops listening."""
+    index = _async_get_index(hass)
+    index.async_acquire()
+    index.async_release()
+
+    hass.states.async_set("light.dead", STATE_UNAVAILABLE)
+    await hass.async_block_till_done()
+
+    assert index.zombie_candidates == {}
+    assert _async_get_index(hass) is not index
@@ -0,0 +1,120 @@
+"""Known input/output pairs for the HAGHS scoring logic."""
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import State
+
+from custom_components.haghs import HaghsDataUpdateCoordinator as Coordinator
+
+
+@pytest.mark.parametrize(
+    ("cpu", "expected"),
+    [
+        (0, 0),
+        (25, 0),
+        (25.1, 10),
+        (40, 10),
+        (40.1, 25),
+        (60, 25),
+        (60.1, 50),
+        (80, 50),
+        (80.1, 80),
+        (100, 80),
+    ],
+)
+def test_classic_cpu_penalty(cpu: float, expected: int) -> None:
+    """Classic CPU usage tiers at 25 / 40 / 60 / 80 %."""
+    assert Coordinator._classic_cpu_penalty(cpu) == expected
+
+
+@pytest.mark.parametrize(
+    ("ram", "expected"),
+    [
+        (69.9, 0),
+        (70, 0),
+        (75, 16),
+        (80, 33),
+        (85, 49),
+        (89.9, 66),
+        (90, 80),
+    ],
+)
+def test_classic_ram_penalty(ram: float, expected: int) -> None:
+    """Classic RAM usage ramps from 70 % and caps at 90 %."""
+    assert Coordinator._classic_ram_penalty(ram) == expected
+
+
+@pytest.mark.parametrize(
+    ("psi", "expected"),
+    [
+        (0, 0),
+        (5, 0),
+        (5.01, 10),
+        (15, 10),
+        (15.01, 25),
+        (30, 25),
+        (30.01, 50),
+        (50, 50),
+        (50.01, 80),
+    ],
+)
+def test_psi_cpu_and_io_penalty(psi: float, expected: int) -> None:
+    """PSI CPU and I/O share the 5 / 15 / 30 / 50 % tiers."""
+    assert Coordinator._psi_cpu_penalty(psi) == expected
+    assert Coordinator._psi_io_penalty(psi) == expected
+
+
+@pytest.mark.parametrize(
+    ("psi", "expected"),
+    [
+        (0, 0),
+        (5, 0),
+        (5.01, 10),
+        (10, 10),
+        (10.01, 25),
+        (25, 25),
+        (25.01, 50),
+        (40, 50),
+        (40.01, 80),
+    ],
+)
+def test_psi_memory_penalty(psi: float, expected: int) -> None:
+    """PSI memory uses the tighter 5 / 10 / 25 / 40 % tiers."""
+    assert Coordinator._psi_memory_penalty(psi) == expected
+
+
+@pytest.mark.parametrize(
+    ("hardware", "app", "expected"),
+    [
+        (100, 100, 100),
+        (0, 0, 0),
+        (74.0, 74, 74),
+        # 0.4 * 16.0 + 0.6 * 96 is exactly 64; float math floored to 63
+        (16.0, 96, 64),
+        (99, 100, 99),
+        (100, 99, 99),
+        (50, 51, 50),
+        (50, 52, 51),
+        (49.9, 100, 79),
+    ],
+)
+def test_weighted_global_score(hardware: float, app: int, expected: int) -> None:
+    """Global score is the 2:3 weighted mean, floored."""
+    assert Coordinator._weighted_global_score(hardware, app) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("42.5", 42.5),
+        ("unavailable", 0.0),
+        ("unknown", 0.0),
+        ("n/a", 0.0),
+        ("nan", 0.0),
+        ("inf", 0.0),
+    ],
+)
+def test_parse_float(value: str, expected: float) -> None:
+    """Unreadable and non-finite states parse as 0.0."""
+    assert Coordinator._parse_float(State("sensor.cpu", value)) == expected